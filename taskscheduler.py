@@ -39,6 +39,12 @@ scheduler.delete_task('\\path\\to\\task')  # Only the path is needed
 #   - Deletes tasks in folder but missing from list
 scheduler.sync(tasks)
 
+# Sync many folders at once, each folder is synced with its own tasks
+scheduler.sync_bulk(tasks)
+
+# Sync with concurrent registrations and deletions on a thread pool
+scheduler.sync_async(tasks)
+
 
 Additionnal reference:
   - Win32 Task Data Model: https://docs.microsoft.com/en-us/windows/win32/taskschd/task-scheduler-objects
@@ -70,148 +76,150 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import contextlib
+from __future__ import annotations
+
 import datetime
 import logging
 import os
-from dataclasses import dataclass
-from functools import reduce
+import sys
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
+from queue import Empty, SimpleQueue
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-import pywintypes
-import win32com.client
+if TYPE_CHECKING:
+    import win32com.client
 
 logger = logging.getLogger(__name__)
 
+
+def _frozen(mapping: dict[str, int]) -> Mapping[str, int]:
+    """Read-only view of a constant mapping, with interned keys"""
+    return MappingProxyType({sys.intern(k): v for k, v in mapping.items()})
+
+
 # Mappings for the constants
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/trigger-type
-TRIGGER_TYPES: dict[str, int] = {
-    'EVENT': 0,
-    'TIME': 1,
-    'DAILY': 2,
-    'WEEKLY': 3,
-    'MONTHLY': 4,
-    'MONTHLYDOW': 5,
-    'IDLE': 6,
-    'REGISTRATION': 7,
-    'BOOT': 8,
-    'LOGON': 9,
-    'SESSION_STATE_CHANGE': 11,
-}
+TRIGGER_TYPES: Mapping[str, int] = _frozen(
+    {
+        'EVENT': 0,
+        'TIME': 1,
+        'DAILY': 2,
+        'WEEKLY': 3,
+        'MONTHLY': 4,
+        'MONTHLYDOW': 5,
+        'IDLE': 6,
+        'REGISTRATION': 7,
+        'BOOT': 8,
+        'LOGON': 9,
+        'SESSION_STATE_CHANGE': 11,
+    }
+)
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/action-type
-ACTION_TYPES: dict[str, int] = {
-    'EXEC': 0,
-    'COM_HANDLER': 5,
-    'SEND_EMAIL': 6,
-    'SHOW_MESSAGE': 7,
-}
+ACTION_TYPES: Mapping[str, int] = _frozen(
+    {
+        'EXEC': 0,
+        'COM_HANDLER': 5,
+        'SEND_EMAIL': 6,
+        'SHOW_MESSAGE': 7,
+    }
+)
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/taskfolder-registertask
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/principal-logontype
-LOGON_TYPES: dict[str, int] = {
-    'NONE': 0,
-    'PASSWORD': 1,
-    'S4U': 2,
-    'INTERACTIVE_TOKEN': 3,
-    'GROUP': 4,
-    'SERVICE_ACCOUNT': 5,
-    'INTERACTIVE_TOKEN_OR_PASSWORD': 6,
-}
+LOGON_TYPES: Mapping[str, int] = _frozen(
+    {
+        'NONE': 0,
+        'PASSWORD': 1,
+        'S4U': 2,
+        'INTERACTIVE_TOKEN': 3,
+        'GROUP': 4,
+        'SERVICE_ACCOUNT': 5,
+        'INTERACTIVE_TOKEN_OR_PASSWORD': 6,
+    }
+)
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/principal-runlevel
-TASK_RUNLEVEL_TYPE: dict[str, int] = {'LUA': 0, 'HIGHEST': 1}
+TASK_RUNLEVEL_TYPE: Mapping[str, int] = _frozen({'LUA': 0, 'HIGHEST': 1})
 
 # Bit Flags Mappings
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/taskfolder-registertask
-TASK_CREATION_FLAGS: dict[str, int] = {
-    'VALIDATE_ONLY': 0x1,
-    'CREATE': 0x2,
-    'UPDATE': 0x4,
-    'CREATE_OR_UPDATE': 0x6,
-    'DISABLE': 0x8,
-    'DONT_ADD_PRINCIPAL_ACE': 0x10,
-    'IGNORE_REGISTRATION_TRIGGERS': 0x20,
-}
+TASK_CREATION_FLAGS: Mapping[str, int] = _frozen(
+    {
+        'VALIDATE_ONLY': 0x1,
+        'CREATE': 0x2,
+        'UPDATE': 0x4,
+        'CREATE_OR_UPDATE': 0x6,
+        'DISABLE': 0x8,
+        'DONT_ADD_PRINCIPAL_ACE': 0x10,
+        'IGNORE_REGISTRATION_TRIGGERS': 0x20,
+    }
+)
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/monthlydowtrigger-daysofweek
-DAYSOFWEEK: dict[str, int] = {
-    'Sunday': 0x1,
-    'Monday': 0x2,
-    'Tuesday': 0x4,
-    'Wednesday': 0x8,
-    'Thursday': 0x10,
-    'Friday': 0x20,
-    'Saturday': 0x40,
-}
+DAYSOFWEEK: Mapping[str, int] = _frozen(
+    {
+        'Sunday': 0x1,
+        'Monday': 0x2,
+        'Tuesday': 0x4,
+        'Wednesday': 0x8,
+        'Thursday': 0x10,
+        'Friday': 0x20,
+        'Saturday': 0x40,
+    }
+)
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/monthlytrigger-daysofmonth
-DAYSOFMONTH: dict[str, int] = {
-    '1': 0x1,
-    '2': 0x2,
-    '3': 0x4,
-    '4': 0x8,
-    '5': 0x10,
-    '6': 0x20,
-    '7': 0x40,
-    '8': 0x80,
-    '9': 0x100,
-    '10': 0x200,
-    '11': 0x400,
-    '12': 0x800,
-    '13': 0x1000,
-    '14': 0x2000,
-    '15': 0x4000,
-    '16': 0x8000,
-    '17': 0x10000,
-    '18': 0x20000,
-    '19': 0x40000,
-    '20': 0x80000,
-    '21': 0x100000,
-    '22': 0x200000,
-    '23': 0x400000,
-    '24': 0x800000,
-    '25': 0x1000000,
-    '26': 0x2000000,
-    '27': 0x4000000,
-    '28': 0x8000000,
-    '29': 0x10000000,
-    '30': 0x20000000,
-    '31': 0x40000000,
-    'Last': 0x80000000,  # Seems buggy with pywin32; 0x80000000 is max int32
-}
+DAYSOFMONTH: Mapping[str, int] = _frozen(
+    {
+        **{str(day): 1 << (day - 1) for day in range(1, 32)},  # '1': 0x1, '2': 0x2, ..., '31': 0x40000000
+        'Last': 0x80000000,  # Seems buggy with pywin32; 0x80000000 is max int32
+    }
+)
 
 # https://learn.microsoft.com/en-us/windows/win32/taskschd/monthlytrigger-monthsofyear
-MONTHSOFYEAR: dict[str, int] = {
-    'January': 0x1,
-    'February': 0x2,
-    'March': 0x4,
-    'April': 0x8,
-    'May': 0x10,
-    'June': 0x20,
-    'July': 0x40,
-    'August': 0x80,
-    'September': 0x100,
-    'October': 0x200,
-    'November': 0x400,
-    'December': 0x800,
-}
-
-MAPPINGS: dict[str, dict[str, int]] = {'LogonType': LOGON_TYPES, 'RunLevel': TASK_RUNLEVEL_TYPE}
-
-BITFLAG_MAPPINGS: dict[str, dict[str, int]] = {
-    'DaysOfWeek': DAYSOFWEEK,
-    'DaysOfMonth': DAYSOFMONTH,
-    'MonthsOfYear': MONTHSOFYEAR,
-}
-
-
+MONTHSOFYEAR: Mapping[str, int] = _frozen(
+    {
+        'January': 0x1,
+        'February': 0x2,
+        'March': 0x4,
+        'April': 0x8,
+        'May': 0x10,
+        'June': 0x20,
+        'July': 0x40,
+        'August': 0x80,
+        'September': 0x100,
+        'October': 0x200,
+        'November': 0x400,
+        'December': 0x800,
+    }
+)
+
+MAPPINGS: Mapping[str, Mapping[str, int]] = MappingProxyType({'LogonType': LOGON_TYPES, 'RunLevel': TASK_RUNLEVEL_TYPE})
+
+BITFLAG_MAPPINGS: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        'DaysOfWeek': DAYSOFWEEK,
+        'DaysOfMonth': DAYSOFMONTH,
+        'MonthsOfYear': MONTHSOFYEAR,
+    }
+)
+
+# Attributes holding collections whose items must be created by type
+_COLLECTIONS: frozenset[str] = frozenset({'Triggers', 'Actions'})
+
+
+@lru_cache(maxsize=1)
 def default_author() -> str:
     """Identical to the default used by the Task Scheduler's wizard"""
-    domain = os.environ['USERDOMAIN']
+    domain = os.environ.get('USERDOMAIN', '')
     author = os.getlogin()
     return f'{domain}\\{author}' if domain else author
 
@@ -227,8 +235,44 @@ def filter_keys(d: dict, keys: list) -> dict:
     return {k: v for k, v in d.items() if k not in keys}
 
 
-def flag_value(li: list[str | int], mapping: dict[str, int]) -> int:
-    return reduce(lambda a, x: a | mapping.get(x, x), li, 0)  # type: ignore
+def flag_value(li: list[str | int], mapping: Mapping[str, int]) -> int:
+    value = 0
+    for flag in li:
+        value |= mapping.get(flag, flag)  # type: ignore
+    return value
+
+
+def _materialize_defaults(value: Any) -> Any:
+    """Returns a copy of the defaults with dynamic values (ex: creation date) evaluated and dates as iso str"""
+    if isinstance(value, dict):
+        return {k: _materialize_defaults(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_materialize_defaults(v) for v in value]
+    elif isinstance(value, datetime.date):
+        return value.isoformat()
+    elif callable(value):
+        return value()
+
+    return value
+
+
+# HRESULTs of a folder that doesn't exist (anymore): ERROR_FILE_NOT_FOUND and ERROR_PATH_NOT_FOUND
+_NOT_FOUND_HRESULTS: frozenset[int] = frozenset({0x80070002, 0x80070003})
+
+
+def _is_not_found(error: Exception) -> bool:
+    """If the com_error is a missing file/path, either as its HRESULT or as the scode of its exception info"""
+    # com_error args: (hresult, message, excepinfo, argerror), excepinfo's last item being the scode
+    args = error.args
+    codes = [args[0] if args else None]
+    if len(args) > 2 and args[2]:
+        codes.append(args[2][-1])
+    return any(isinstance(code, int) and code & 0xFFFFFFFF in _NOT_FOUND_HRESULTS for code in codes)
+
+
+def _folder_key(path: str | Path) -> str:
+    """Folder cache key, case-insensitive and without trailing separator like Windows paths"""
+    return str(path).rstrip('\\').lower()
 
 
 def task_path(path: str) -> Path:
@@ -236,14 +280,21 @@ def task_path(path: str) -> Path:
     return Path(path if path.startswith('\\') else f'\\{path}')
 
 
+# Value type and parser of each mapped key, so parse_value only needs a single lookup
+_PARSERS: dict[str, tuple[type, Callable[[Any], Any]]] = {
+    k: (list, partial(flag_value, mapping=m)) for k, m in BITFLAG_MAPPINGS.items()
+} | {k: (str, m.__getitem__) for k, m in MAPPINGS.items()}
+
+
 def parse_value(key: str, value: Any) -> Any:
-    if key in BITFLAG_MAPPINGS and isinstance(value, list):
-        # If the value must be computed from a list of flags
-        return flag_value(value, BITFLAG_MAPPINGS[key])
-    elif key in MAPPINGS and isinstance(value, str):
-        # If the value can be str-mapped
-        return MAPPINGS[key][value]
-    elif isinstance(value, datetime.date):
+    parser = _PARSERS.get(key)
+    if parser is not None:
+        value_type, parse = parser
+        if isinstance(value, value_type):
+            # If the value must be computed from a list of flags or can be str-mapped
+            return parse(value)
+
+    if isinstance(value, datetime.date):
         # Dates must be converted to iso str
         return value.isoformat()
     elif callable(value):
@@ -254,43 +305,72 @@ def parse_value(key: str, value: Any) -> Any:
 
 
 def set_task_attributes(task: win32com.client.CDispatch, attributes: Any) -> None:
-    for key, value in attributes.items():
-        if isinstance(value, dict):
-            # Recursively set attributes for nested dictionaries
-            set_task_attributes(getattr(task, key), value)
-        elif isinstance(value, list) and key in ('Triggers', 'Actions'):
-            # Handle lists for Triggers and Actions collections
-            collection = getattr(task, key)
-            for item in value:
-                if key == 'Triggers':
-                    collection_item = collection.Create(TRIGGER_TYPES.get(item['Type'], item['Type']))
-                elif key == 'Actions':
-                    collection_item = collection.Create(ACTION_TYPES.get(item['Type'], item['Type']))
-                set_task_attributes(collection_item, filter_keys(item, ['Type']))
-        else:
-            # Set value
-            setattr(task, key, parse_value(key, value))
-
-
-@dataclass
+    # Globals and builtins used in the loop are bound to locals for faster lookups
+    _getattr, _setattr, _isinstance, _parse_value = getattr, setattr, isinstance, parse_value
+    trigger_types, action_types = TRIGGER_TYPES, ACTION_TYPES
+
+    # Walk the nested attributes with an explicit stack of (COM object, attributes, key to skip) instead of recursing
+    stack: list[tuple[Any, dict[str, Any], str | None]] = [(task, attributes, None)]
+    push, pop = stack.append, stack.pop
+    while stack:
+        obj, attrs, skipped_key = pop()
+        for key, value in attrs.items():
+            if key == skipped_key:
+                continue
+            elif _isinstance(value, dict):
+                # Nested dictionaries are set on the matching child object
+                push((_getattr(obj, key), value, None))
+            elif _isinstance(value, list) and key in _COLLECTIONS:
+                # Handle lists for Triggers and Actions collections
+                collection = _getattr(obj, key)
+                types = trigger_types if key == 'Triggers' else action_types
+                for item in value:
+                    # The item's Type is only used to create it, it's skipped instead of copying the item without it
+                    type_value = item['Type']
+                    push((collection.Create(types.get(type_value, type_value)), item, 'Type'))
+            else:
+                # Set value
+                _setattr(obj, key, _parse_value(key, value))
+
+
+@dataclass(slots=True)
 class Task:
     path: Path
     definition: win32com.client.CDispatch
+    folder: str = field(init=False)  # str(path.parent), cached since sync needs it for every task
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # The cached folder is refreshed whenever the path is assigned, including by __init__
+        object.__setattr__(self, name, value)
+        if name == 'path':
+            object.__setattr__(self, 'folder', str(value.parent))
 
 
 class TaskScheduler:
-    def __init__(self, task_defaults: dict[str, Any] = TASK_DEFAULTS) -> None:
+    def __init__(self, task_defaults: dict[str, Any] = TASK_DEFAULTS, static_defaults: bool = False) -> None:
+        """
+        With static_defaults, the defaults' dynamic values (ex: creation date) are evaluated once and reused for every
+        build instead of being evaluated on each build
+        """
+        # pywin32 is imported lazily since it's slow to load and the constants can be used without it
+        import pywintypes
+        import win32com.client
+
+        self._com_error = pywintypes.com_error
         self.client: win32com.client.dynamic.CDispatch = win32com.client.Dispatch('Schedule.Service')
         logger.debug('Connecting to Schedule.Service win32com')
         self.client.Connect()
         self.root: win32com.client.CDispatch = self.client.GetFolder('\\')
         self.task_defaults = task_defaults
+        self._static_defaults = _materialize_defaults(task_defaults) if static_defaults else None
+        self._folders: dict[str, win32com.client.CDispatch] = {}
 
     def build(self, task_attributes: dict[str, Any]) -> Task:
         """Applies the defaults first, then task_attributes"""
         logger.debug('Building task %s', task_attributes['Path'])
         task_def = self.client.NewTask(0)
-        set_task_attributes(task_def, self.task_defaults)
+        defaults = self._static_defaults if self._static_defaults is not None else self.task_defaults
+        set_task_attributes(task_def, defaults)
         set_task_attributes(task_def, filter_keys(task_attributes, ['Path']))
         return Task(task_path(task_attributes['Path']), task_def)
 
@@ -302,28 +382,56 @@ class TaskScheduler:
         password: str | None = None,
         creation_flag: str = 'CREATE_OR_UPDATE',
     ) -> None:
-        logger.debug('Registering task %s with flag %s', task.path, creation_flag)
-        self._get_and_create_folder(task.path.parent).RegisterTaskDefinition(
-            task.path.name,
-            task.definition,
-            flag_value([creation_flag], TASK_CREATION_FLAGS),
-            userId,
-            password,
-            LOGON_TYPES.get(logonType, logonType),
+        self._register_on_folder(
+            self._get_and_create_folder(task.folder),
+            task,
+            logonType=logonType,
+            userId=userId,
+            password=password,
+            creation_flag=creation_flag,
         )
 
+    def _register_on_folder(
+        self,
+        folder: win32com.client.CDispatch,
+        task: Task,
+        logonType: str = 'S4U',
+        userId: str | None = None,
+        password: str | None = None,
+        creation_flag: str = 'CREATE_OR_UPDATE',
+    ) -> win32com.client.CDispatch:
+        """
+        Registers the task on an already resolved folder COM object and returns the folder used.
+        If the folder was deleted since it was cached, it's resolved again and the registration is retried once.
+        Any other error is raised as is.
+        """
+        logger.debug('Registering task %s with flag %s', task.path, creation_flag)
+        flag = TASK_CREATION_FLAGS.get(creation_flag, creation_flag)
+        logon_type = LOGON_TYPES.get(logonType, logonType)
+        try:
+            folder.RegisterTaskDefinition(task.path.name, task.definition, flag, userId, password, logon_type)
+            return folder
+        except self._com_error as error:
+            if not _is_not_found(error):
+                raise
+
+        self._forget_folder(task.folder)
+        folder = self._get_and_create_folder(task.folder)
+        folder.RegisterTaskDefinition(task.path.name, task.definition, flag, userId, password, logon_type)
+        return folder
+
     def task_exists(self, path: str | Path) -> bool:
         try:
             self.root.getTask(str(path))
             return True
-        except pywintypes.com_error:
+        except self._com_error:
             return False
 
     def folder_exists(self, path: str | Path) -> bool:
         try:
             self.root.getFolder(str(path))
             return True
-        except pywintypes.com_error:
+        except self._com_error:
             return False
 
     def get_tasks(self, path: str | Path) -> list[win32com.client.CDispatch]:
@@ -336,6 +444,7 @@ class TaskScheduler:
     def delete_folder(self, path: str | Path) -> None:
         logger.debug('Deleting folder %s', path)
         self.root.DeleteFolder(str(path), 0)
+        self._forget_folder(path)
 
     def sync(
         self, tasks: list[Task], logonType: str = 'S4U', userId: str | None = None, password: str | None = None
@@ -348,32 +457,200 @@ class TaskScheduler:
         The tasks must belong to the same folder and can't be in the root folder
         (since most applications put their tasks there, it woulkd be too dangerous to delete them)
         """
+        self._sync_folder(self._sync_folder_of(tasks), tasks, logonType=logonType, userId=userId, password=password)
+
+    def sync_async(
+        self,
+        tasks: list[Task],
+        logonType: str = 'S4U',
+        userId: str | None = None,
+        password: str | None = None,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Same as sync, but the tasks are registered, then deleted, concurrently on a thread pool.
+        Returns once every task is synced.
+
+        COM objects can't be shared between threads, so each worker connects to its own Schedule.Service
+        and the tasks are registered from their XML definition.
+        """
+        import pythoncom
+        import win32com.client
+
+        folder = self._sync_folder_of(tasks)
+        _, registrations, deletions = self._sync_plan(folder, tasks)
+        logon_type = LOGON_TYPES.get(logonType, logonType)
+
+        def run(jobs: list[Any], action: Callable[[Any, Any], None]) -> None:
+            """Runs the action for every job on a thread pool, each worker connecting to its own Schedule.Service"""
+            pending: SimpleQueue[Any] = SimpleQueue()
+            for job in jobs:
+                pending.put(job)
+
+            def work() -> None:
+                pythoncom.CoInitialize()
+                client = folder_com = error = None
+                try:
+                    client = win32com.client.Dispatch('Schedule.Service')
+                    client.Connect()
+                    folder_com = client.GetFolder(folder)
+                    while True:
+                        try:
+                            job = pending.get_nowait()
+                        except Empty:
+                            break
+                        action(folder_com, job)
+                except Exception as e:
+                    # The traceback's frames hold COM objects, so the error is only kept without it
+                    error = e.with_traceback(None)
+                    error.__cause__ = error.__context__ = None
+                finally:
+                    # The COM objects must be released before COM is uninitialized on this thread
+                    del client, folder_com
+                    pythoncom.CoUninitialize()
+
+                if error is not None:
+                    raise error
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(work) for _ in range(min(max_workers, len(jobs)))]
+            # Raises the first error, if any
+            for future in futures:
+                future.result()
+
+        def register(folder_com: Any, registration: tuple[str, str, str]) -> None:
+            name, xml, creation_flag = registration
+            logger.debug('Registering task %s\\%s with flag %s', folder, name, creation_flag)
+            folder_com.RegisterTask(name, xml, TASK_CREATION_FLAGS[creation_flag], userId, password, logon_type)
+
+        def delete(folder_com: Any, path: str) -> None:
+            logger.debug('Deleting task %s', path)
+            folder_com.DeleteTask(path.rsplit('\\', 1)[-1], 0)
+
+        # The COM objects are only read from this thread, the workers get plain str
+        run([(task.path.name, task.definition.XmlText, flag) for task, flag in registrations], register)
+        run(deletions, delete)
+
+    def sync_bulk(
+        self, tasks: list[Task], logonType: str = 'S4U', userId: str | None = None, password: str | None = None
+    ) -> None:
+        """
+        Same as sync, but the tasks can belong to many folders. Each folder is synced with its own tasks.
+
+        None of the folders can be root (since most applications put their tasks there, it would be too dangerous to
+        delete them)
+        """
         # Validation
-        if len({task.path.parent for task in tasks}) > 1:
+        # Folders are grouped case-insensitively, like Windows paths
+        tasks_by_folder: dict[str, list[Task]] = {}
+        for task in tasks:
+            tasks_by_folder.setdefault(task.folder.lower(), []).append(task)
+
+        if '\\' in tasks_by_folder:
+            raise AttributeError("The tasks' folders can't be root (there is a high risk of deleting unrelated tasks)")
+
+        for folder_tasks in tasks_by_folder.values():
+            self._sync_folder(
+                folder_tasks[0].folder, folder_tasks, logonType=logonType, userId=userId, password=password
+            )
+
+    def _sync_folder_of(self, tasks: list[Task]) -> str:
+        """Validates that the tasks can be synced and returns their folder"""
+        if len({task.folder.lower() for task in tasks}) > 1:
             raise AttributeError('The tasks must belong to the same folder')
 
-        folder = tasks[0].path.parent
+        folder = tasks[0].folder
 
-        if folder == Path('\\'):
+        if folder == '\\':
             raise AttributeError("The tasks' folder can't be root (there is a high risk of deleting unrelated tasks)")
 
+        return folder
+
+    def _sync_folder(
+        self,
+        folder: str,
+        tasks: list[Task],
+        logonType: str = 'S4U',
+        userId: str | None = None,
+        password: str | None = None,
+    ) -> None:
+        folder_com, registrations, deletions = self._sync_plan(folder, tasks)
+
         # Creation / Update
-        for task in tasks:
-            self.register(
+        for task, creation_flag in registrations:
+            folder_com = self._register_on_folder(
+                folder_com,
                 task,
                 logonType=logonType,
                 userId=userId,
                 password=password,
-                creation_flag='UPDATE' if self.task_exists(task.path) else 'CREATE',
+                creation_flag=creation_flag,
             )
 
         # Suppression
-        folder_task_paths = set(Path(task.Path) for task in self.get_tasks(folder))
-        wanted_task_paths = {task.path for task in tasks}
-        for path in folder_task_paths - wanted_task_paths:
+        for path in deletions:
             self.delete_task(path)
 
+    def _sync_plan(
+        self, folder: str, tasks: list[Task]
+    ) -> tuple[win32com.client.CDispatch, list[tuple[Task, str]], list[str]]:
+        """
+        Returns the folder, the tasks to register with their creation flag and the paths of the tasks to delete.
+        The folder is resolved and enumerated only once, the existing tasks are reused for the whole sync.
+        """
+        folder_com, existing_tasks = self._get_folder_tasks(folder)
+        # Paths are compared as lowercase str (like Windows paths) and mapped to the path returned by COM
+        folder_task_paths = {task.Path.lower(): task.Path for task in existing_tasks}
+
+        # Each task's path is converted once and reused for registration and suppression.
+        # A path given more than once is only registered once, with its last definition (the one that would remain).
+        wanted_tasks = {str(task.path).lower(): task for task in tasks}
+        registrations = [
+            (task, 'UPDATE' if path in folder_task_paths else 'CREATE') for path, task in wanted_tasks.items()
+        ]
+
+        # The folder isn't enumerated again after the registrations: the registered tasks are all wanted, so only the
+        # tasks that existed before can be deleted
+        deletions = [folder_task_paths[path] for path in folder_task_paths.keys() - wanted_tasks.keys()]
+
+        return folder_com, registrations, deletions
+
     def _get_and_create_folder(self, path: str | Path) -> win32com.client.CDispatch:
-        with contextlib.suppress(pywintypes.com_error):
-            self.root.CreateFolder(str(path))
-        return self.client.GetFolder(str(path))
+        """Folders are cached since they are resolved for every registered task"""
+        path = str(path)
+        key = _folder_key(path)
+        folder = self._folders.get(key)
+        if folder is not None:
+            return folder
+
+        try:
+            folder = self.client.GetFolder(path)
+        except self._com_error:
+            try:
+                self.root.CreateFolder(path)
+            except self._com_error:
+                # Created in the meantime
+                pass
+            folder = self.client.GetFolder(path)
+
+        self._folders[key] = folder
+        return folder
+
+    def _get_folder_tasks(self, path: str | Path) -> tuple[win32com.client.CDispatch, list[win32com.client.CDispatch]]:
+        """Returns the folder and its tasks, resolving the folder again if the cached one was deleted since"""
+        folder = self._get_and_create_folder(path)
+        try:
+            return folder, folder.GetTasks(0)
+        except self._com_error as error:
+            if not _is_not_found(error):
+                raise
+
+        self._forget_folder(path)
+        folder = self._get_and_create_folder(path)
+        return folder, folder.GetTasks(0)
+
+    def _forget_folder(self, path: str | Path) -> None:
+        """Removes the folder and its subfolders from the cache"""
+        key = _folder_key(path)
+        for cached_key in [k for k in self._folders if k == key or k.startswith(key + '\\')]:
+            del self._folders[cached_key]